@@ -1,22 +1,47 @@
 """
 AxiomHive AI Strategic Framework - Core Package
 
-This package contains the core intelligence, prediction, and automation
-systems that power the AxiomHive strategic framework.
+This package contains the core agent framework (agents, tasks, usage
+tracking, pooling and coordination) that powers the AxiomHive strategic
+framework.
+
+Public names are imported lazily on first access, so importing one
+submodule (e.g. ``core.agent``) does not load the others.
 
 Copyright (c) 2025 AxiomHive. All rights reserved.
 """
 
+import importlib
+
 __version__ = '1.0.0'
 __author__ = 'AxiomHive'
 __license__ = 'Proprietary'
 
-from .intelligence import StrategicEngine
-from .prediction import ForecastEngine
-from .automation import DecisionAgent
+_LAZY_IMPORTS = {
+    'Agent': '.agent',
+    'AgentResult': '.agent',
+    'AgentPool': '.pool',
+    'AgentCoordinator': '.coordinator',
+    'Task': '.tasks',
+    'TaskConfig': '.tasks',
+    'UsageTracker': '.usage',
+}
 
 __all__ = [
-    'StrategicEngine',
-    'ForecastEngine',
-    'DecisionAgent',
+    'Agent',
+    'AgentResult',
+    'AgentPool',
+    'AgentCoordinator',
+    'Task',
+    'TaskConfig',
+    'UsageTracker',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,36 @@
+"""
+AxiomHive AI Framework - Compiled Kernels
+
+Numeric helpers for benchmarking, compiled with Numba when it is installed.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _scan_budget(prompt, completion, cost_per_token, budget):
+    """Replay token counts against a budget and find where it is reached.
+    
+    Args:
+        prompt: Array of prompt token counts per call
+        completion: Array of completion token counts per call
+        cost_per_token: Cost per token
+        budget: Budget limit in dollars
+    
+    Returns:
+        Tuple[int, float]: Index of the call that reaches the budget (-1 if
+        never reached) and the running cost at that point
+    """
+    total = 0.0
+    for i in range(len(prompt)):
+        total += (prompt[i] + completion[i]) * cost_per_token
+        if total >= budget:
+            return i, float(total)
+    return -1, float(total)
+
+
+# Compiled with Numba when available; cache=True keeps the compiled code
+# on disk so only the first run pays the compile cost.
+scan_budget = njit(cache=True)(_scan_budget) if njit is not None else _scan_budget
@@ -0,0 +1,25 @@
+"""
+AxiomHive AI Framework - JSON Encoding
+
+Shared JSON encoder for structured output; uses orjson when installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string with orjson (C extension).
+        
+        OPT_NON_STR_KEYS stringifies non-str dict keys like the stdlib does.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize to a JSON string (stdlib fallback when orjson is missing)."""
+        return json.dumps(obj, indent=2 if indent else None)
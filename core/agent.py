@@ -0,0 +1,383 @@
+"""
+AxiomHive AI Framework - Agent
+
+Modular AI agent with budget control, structured output and concurrent
+task execution.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ._json import _dumps
+from .tasks import Task, TaskConfig
+from .usage import UsageTracker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class AgentResult:
+    """Result of a batch run by Agent.run() / Agent.arun().
+    
+    Structured Output:
+    {
+        "agent": str,
+        "status": str,
+        "results": List[Dict[str, Any]],
+        "usage": Dict[str, Any]
+    }
+    """
+    agent: str
+    status: str
+    results: List[Dict[str, Any]]
+    usage: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict, sharing the nested values.
+        
+        Unlike dataclasses.asdict(), nested results are not deep-copied.
+        """
+        return {
+            "agent": self.agent,
+            "status": self.status,
+            "results": self.results,
+            "usage": self.usage
+        }
+    
+    def to_json(self) -> str:
+        """Convert to JSON string."""
+        return _dumps(self.to_dict())
+
+
+class Agent:
+    """Modular AI agent with budget control and structured output.
+    
+    Example usage:
+        agent = Agent(max_tokens=1000, budget_limit=0.50)
+        result = agent.execute_task(task, track_usage=True)
+
+        # Run independent tasks concurrently
+        agent.add_task(task, query="first")
+        agent.add_task(task, query="second")
+        batch = agent.run()
+        
+        # Reuse one agent per configuration
+        agent = Agent.get_or_create("DataProcessor", budget_limit=0.50)
+    """
+    
+    # Agents cached by get_or_create(), keyed on configuration, with the
+    # time each was last handed out
+    _cache: Dict[Tuple[Any, ...], Tuple["Agent", float]] = {}
+    _cache_lock = threading.Lock()
+    max_idle_sec: float = 300.0
+    
+    def __init__(self, 
+                 max_tokens: int = 1000, 
+                 budget_limit: float = 1.0,
+                 cost_per_1k: float = 0.002,
+                 executor: Optional[Executor] = None,
+                 name: str = "Agent"):
+        """Initialize agent with budget controls.
+        
+        Args:
+            max_tokens: Maximum tokens per request
+            budget_limit: Maximum cost limit in dollars
+            cost_per_1k: Cost per 1000 tokens
+            executor: Executor running blocking tasks in run()/arun(); by
+                default each run uses a private pool sized to the batch
+            name: Agent name used in logs and structured output
+        """
+        self.name = name
+        self.config = TaskConfig(max_tokens=max_tokens, budget_limit=budget_limit)
+        self.usage_tracker = UsageTracker()
+        self.cost_per_1k = cost_per_1k  # also sets cost_per_token
+        self.budget_callback: Optional[Callable[[UsageTracker], None]] = None
+        self._last_within = True
+        self._budget_lock = threading.Lock()
+        self.executor = executor
+        self.tasks: Deque[Tuple[Task, Dict[str, Any]]] = deque()
+        logger.info("Agent %s initialized with budget limit: $%s", name, budget_limit)
+    
+    @property
+    def cost_per_1k(self) -> float:
+        """Cost per 1000 tokens."""
+        return self._cost_per_1k
+    
+    @cost_per_1k.setter
+    def cost_per_1k(self, value: float) -> None:
+        self._cost_per_1k = value
+        # Precomputed so usage logging multiplies instead of divides
+        self.cost_per_token = value / 1000.0
+    
+    @classmethod
+    def get_or_create(cls, name: str,
+                      max_tokens: int = 1000,
+                      budget_limit: float = 1.0,
+                      cost_per_1k: float = 0.002) -> "Agent":
+        """Return a reset, cached agent for this configuration.
+        
+        Agents created here are reused by later calls with the same
+        arguments, so callers sharing a configuration share one instance.
+        Entries unused for longer than max_idle_sec are evicted.
+        
+        Returns:
+            Agent: Cached agent, reset to a fresh state
+        """
+        key = (cls, name, max_tokens, budget_limit, cost_per_1k)
+        now = time.monotonic()
+        with cls._cache_lock:
+            stale = [k for k, (_, last_used) in cls._cache.items()
+                     if now - last_used > cls.max_idle_sec]
+            for k in stale:
+                del cls._cache[k]
+            
+            cached = cls._cache.get(key)
+            if cached is None:
+                agent = cls(max_tokens=max_tokens, budget_limit=budget_limit,
+                            cost_per_1k=cost_per_1k, name=name)
+            else:
+                agent = cached[0]
+                agent.reset()
+            cls._cache[key] = (agent, now)
+            return agent
+    
+    def reset(self) -> None:
+        """Return the agent to a fresh state so it can be reused.
+        
+        Clears queued tasks, usage totals and the budget callback; the
+        configuration and executor are kept.
+        """
+        self.tasks.clear()
+        self.usage_tracker.reset()
+        self.budget_callback = None
+        self._last_within = True
+    
+    def set_budget_callback(self, callback: Callable[[UsageTracker], None]):
+        """Set callback for budget exceeded events.
+        
+        Args:
+            callback: Function to call when budget is exceeded
+        """
+        self.budget_callback = callback
+    
+    def check_budget(self) -> bool:
+        """Check if budget limit is exceeded.
+        
+        The budget callback and warning fire once, when the budget is first
+        exceeded, not on every check.
+        
+        Returns:
+            bool: True if within budget
+        """
+        return self._refresh_budget_state()
+    
+    def _refresh_budget_state(self) -> bool:
+        """Update the within-budget state, notifying on the transition only.
+        
+        Returns:
+            bool: True if within budget
+        """
+        within = not self.usage_tracker.is_budget_exceeded(self.config.budget_limit)
+        if within:
+            self._last_within = True
+        elif self._last_within:
+            with self._budget_lock:
+                transitioned, self._last_within = self._last_within, False
+            if transitioned:
+                if self.budget_callback:
+                    self.budget_callback(self.usage_tracker)
+                logger.warning("Budget exceeded: $%s", self.usage_tracker.estimated_cost)
+        return within
+    
+    def execute_task(self, task: Task, track_usage: bool = True, **kwargs) -> Dict[str, Any]:
+        """Execute a task with budget control.
+        
+        Returns:
+            Dict: Structured output in JSON format:
+            {
+                "status": str,
+                "result": Any,
+                "usage": Dict[str, Any],
+                "within_budget": bool
+            }
+        """
+        if inspect.iscoroutinefunction(task.execute):
+            return {
+                "status": "error",
+                "message": "Coroutine tasks must be run with run() or arun()",
+                "usage": self.usage_tracker.to_dict()
+            }
+        
+        rejected = self._check_task(task, kwargs)
+        if rejected is not None:
+            return rejected
+        
+        try:
+            result = task.execute(**kwargs)
+            return self._record_result(result, track_usage, kwargs)
+        except Exception as e:
+            return self._task_error(e)
+    
+    def add_task(self, task: Task, **kwargs) -> None:
+        """Queue a task for concurrent execution by run().
+        
+        Args:
+            task: Task to execute
+            **kwargs: Parameters passed to the task
+        """
+        self.tasks.append((task, kwargs))
+    
+    def add_tasks(self, tasks: Iterable[Tuple[Task, Dict[str, Any]]]) -> None:
+        """Queue many tasks at once for run().
+        
+        Args:
+            tasks: Iterable of (task, parameters) pairs
+        """
+        self.tasks.extend(tasks)
+    
+    def run(self, track_usage: bool = True) -> "AgentResult":
+        """Execute all queued tasks concurrently (synchronous wrapper).
+        
+        Returns:
+            AgentResult: Structured output, see arun()
+        """
+        return asyncio.run(self.arun(track_usage=track_usage))
+    
+    async def arun(self, track_usage: bool = True) -> "AgentResult":
+        """Execute all queued tasks concurrently with budget control.
+        
+        Tasks are independent, so they are started together and the batch
+        takes roughly as long as its slowest task. Coroutine ``execute``
+        implementations are awaited directly; blocking ones run in worker
+        threads. Once the budget is exceeded, tasks that have not started
+        are cancelled and reported as budget errors; blocking tasks already
+        running in a worker thread are waited for and their usage logged.
+        
+        Returns:
+            AgentResult: Per-task outputs (in queue order) and usage totals
+        """
+        # Size a private pool to the batch so every blocking task overlaps
+        executor = self.executor
+        if executor is None and self.tasks:
+            executor = ThreadPoolExecutor(max_workers=min(32, len(self.tasks)))
+        
+        # Drain the queue so finished tasks are not kept alive by it
+        handles = []
+        while self.tasks:
+            task, kwargs = self.tasks.popleft()
+            handles.append(asyncio.create_task(self._aexecute_task(task, track_usage, kwargs, executor)))
+        
+        try:
+            pending = set(handles)
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if pending and self.usage_tracker.is_budget_exceeded(self.config.budget_limit):
+                    for handle in pending:
+                        handle.cancel()
+                    await asyncio.wait(pending)
+                    break
+        except asyncio.CancelledError:
+            # Don't orphan the per-task handles when arun() itself is cancelled
+            for handle in handles:
+                handle.cancel()
+            if handles:
+                await asyncio.wait(handles)
+            raise
+        finally:
+            if executor is not None and executor is not self.executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        results = [
+            self._budget_error() if handle.cancelled() else handle.result()
+            for handle in handles
+        ]
+        return AgentResult(self.name, "completed", results, self.usage_tracker.to_dict())
+    
+    async def _aexecute_task(self, task: Task, track_usage: bool,
+                             kwargs: Dict[str, Any],
+                             executor: Optional[Executor]) -> Dict[str, Any]:
+        """Async counterpart of execute_task used by arun()."""
+        rejected = self._check_task(task, kwargs)
+        if rejected is not None:
+            return rejected
+        
+        try:
+            if inspect.iscoroutinefunction(task.execute):
+                result = await task.execute(**kwargs)
+            else:
+                future = executor.submit(functools.partial(task.execute, **kwargs))
+                while True:
+                    try:
+                        result = await asyncio.shield(asyncio.wrap_future(future))
+                        break
+                    except asyncio.CancelledError:
+                        if future.cancel():
+                            raise
+                        # Already running in a worker thread: its tokens are
+                        # spent either way, so wait for it and log the usage
+            # No await between logging and the budget check in arun(), so
+            # usage totals stay consistent without an explicit lock.
+            return self._record_result(result, track_usage, kwargs)
+        except Exception as e:
+            return self._task_error(e)
+    
+    def _check_task(self, task: Task, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate input and budget before running a task.
+        
+        Returns:
+            Optional[Dict]: Error output if the task must not run, else None
+        """
+        if not task.validate_input(**kwargs):
+            return {
+                "status": "error",
+                "message": "Invalid input parameters",
+                "usage": self.usage_tracker.to_dict()
+            }
+        
+        if not self.check_budget():
+            return self._budget_error()
+        return None
+    
+    def _budget_error(self) -> Dict[str, Any]:
+        """Structured output for a task rejected by the budget limit."""
+        return {
+            "status": "error",
+            "message": "Budget limit exceeded",
+            "usage": self.usage_tracker.to_dict(),
+            "within_budget": False
+        }
+    
+    def _record_result(self, result: Any, track_usage: bool,
+                       kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Log usage for a finished task and build its structured output."""
+        if track_usage:
+            # Simulate token usage (in production, get from API response)
+            prompt_tokens = kwargs.get('prompt_tokens', 100)
+            completion_tokens = kwargs.get('completion_tokens', 50)
+            usage_data = self.usage_tracker.log_usage(prompt_tokens, completion_tokens, self.cost_per_token)
+            
+            logger.info("Task completed. Usage: %s", usage_data)
+        
+        return {
+            "status": "success",
+            "result": result,
+            "usage": self.usage_tracker.to_dict(),
+            "within_budget": self._refresh_budget_state()
+        }
+    
+    def _task_error(self, error: Exception) -> Dict[str, Any]:
+        """Structured output for a task that raised."""
+        logger.error("Task execution failed: %s", error)
+        return {
+            "status": "error",
+            "message": str(error),
+            "usage": self.usage_tracker.to_dict()
+        }
@@ -0,0 +1,61 @@
+"""
+AxiomHive AI Framework - Agent Coordinator
+
+Concurrent fan-out of queued work across several agents.
+"""
+
+import asyncio
+from typing import Any, Callable, List
+
+from .agent import Agent, AgentResult
+
+
+class AgentCoordinator:
+    """Run several agents concurrently and combine their outputs.
+    
+    Each agent runs its own queued tasks via Agent.arun(), so the batch
+    takes roughly as long as the slowest agent. Agents keep their own
+    usage trackers and budgets.
+    
+    Example usage:
+        planner = Agent(name="Planner", budget_limit=0.50)
+        executor = Agent(name="Executor", budget_limit=1.00)
+        planner.add_task(task, query="plan")
+        executor.add_task(task, query="execute")
+        coordinator = AgentCoordinator([planner, executor])
+        results = coordinator.run()
+    """
+    
+    def __init__(self, agents: List[Agent],
+                 aggregate: Callable[[List[AgentResult]], Any] = list):
+        """Initialize coordinator.
+        
+        Args:
+            agents: Agents to run together
+            aggregate: Function combining the per-agent outputs (in agent
+                order) into the final result
+        """
+        self.agents = agents
+        self.aggregate = aggregate
+    
+    def run(self) -> Any:
+        """Run all agents concurrently (synchronous wrapper).
+        
+        Returns:
+            Any: Aggregated output, see run_parallel()
+        """
+        return asyncio.run(self.run_parallel())
+    
+    async def run_parallel(self) -> Any:
+        """Run all agents concurrently and aggregate their outputs.
+        
+        If an agent fails outright, the others are cancelled and the
+        failure is raised as an ExceptionGroup; task-level errors are
+        reported inside each agent's output instead.
+        
+        Returns:
+            Any: ``aggregate`` applied to the list of Agent.arun() outputs
+        """
+        async with asyncio.TaskGroup() as group:
+            handles = [group.create_task(agent.arun()) for agent in self.agents]
+        return self.aggregate([handle.result() for handle in handles])
@@ -0,0 +1,54 @@
+"""
+AxiomHive AI Framework - Agent Pool
+
+Reuse of agent instances across batches.
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Deque
+
+from .agent import Agent
+
+
+class AgentPool:
+    """Pool of reusable agents for batch workloads.
+    
+    Released agents are reset and kept for the next acquire(), avoiding a
+    fresh Agent (and UsageTracker) per batch.
+    
+    Example usage:
+        pool = AgentPool(lambda: Agent(max_tokens=1000, budget_limit=0.50))
+        agent = pool.acquire()
+        result = agent.execute_task(task, query="...")
+        pool.release(agent)
+    """
+    
+    def __init__(self, factory: Callable[[], Agent], max_size: int = 64):
+        """Initialize an empty pool.
+        
+        Args:
+            factory: Callable creating a new agent when the pool is empty
+            max_size: Maximum number of idle agents kept
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: Deque[Agent] = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> Agent:
+        """Take an idle agent from the pool, creating one if none is idle."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.factory()
+    
+    def release(self, agent: Agent) -> None:
+        """Reset an agent and return it to the pool.
+        
+        Agents beyond max_size are dropped.
+        """
+        agent.reset()
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(agent)
@@ -0,0 +1,49 @@
+"""
+AxiomHive AI Framework - Tasks
+
+Task interface and task configuration.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Protocol
+
+
+@dataclass
+class TaskConfig:
+    """Configuration for agent tasks.
+    
+    Structured Output:
+    {
+        "max_tokens": int,
+        "temperature": float,
+        "budget_limit": float,
+        "enable_tracking": bool
+    }
+    """
+    max_tokens: int = 1000
+    temperature: float = 0.7
+    budget_limit: float = 1.0
+    enable_tracking: bool = True
+
+
+class Task(Protocol):
+    """Structural interface for modular tasks.
+    
+    Any object providing these methods is a task; no base class is needed.
+    """
+    
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        """Execute the task and return structured output.
+        
+        Returns:
+            Dict: Task results in JSON-compatible format
+        """
+        ...
+    
+    def validate_input(self, **kwargs) -> bool:
+        """Validate input parameters.
+        
+        Returns:
+            bool: True if valid
+        """
+        ...
@@ -0,0 +1,251 @@
+"""
+AxiomHive AI Framework - Usage Tracking
+
+API usage and cost accounting for agents.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from ._json import _dumps
+
+
+class _UsageTrackerState:
+    """Internal UsageTracker state kept out of the dataclass fields.
+    
+    Holding the log and lock in base-class slots means
+    asdict(), comparison and repr only see the counters.
+    """
+    __slots__ = ('usage_log', '_lock')
+
+
+@dataclass(slots=True)
+class UsageTracker(_UsageTrackerState):
+    """Track API usage and costs.
+    
+    Structured Output:
+    {
+        "total_tokens": int,
+        "prompt_tokens": int,
+        "completion_tokens": int,
+        "estimated_cost": float,
+        "calls": int
+    }
+    
+    The most recent ``log_capacity`` calls are kept in ``usage_log``;
+    older entries are dropped so memory stays bounded on long runs.
+    """
+    total_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    estimated_cost: float = 0.0
+    calls: int = 0
+    log_capacity: int = 1024
+    
+    def __post_init__(self):
+        self.usage_log: Deque[Dict[str, Any]] = deque(maxlen=self.log_capacity)
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle/copy support; the lock is not carried over."""
+        with self._lock:
+            state = {f.name: getattr(self, f.name) for f in fields(self)}
+            state["usage_log"] = list(self.usage_log)
+            return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        usage_log = state.pop("usage_log")
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.__post_init__()
+        self.usage_log.extend(usage_log)
+    
+    def log_usage(self, prompt_tokens: int, completion_tokens: int, cost_per_token: float = 0.000002) -> Dict[str, Any]:
+        """Log API usage and return structured output.
+        
+        Safe to call from several threads at once.
+        
+        Args:
+            prompt_tokens: Prompt tokens used by this call
+            completion_tokens: Completion tokens used by this call
+            cost_per_token: Cost per token (cost per 1000 tokens / 1000)
+        
+        Returns:
+            Dict: Usage statistics in JSON format
+        """
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            # Charge only this call's tokens, not the running total
+            tokens = prompt_tokens + completion_tokens
+            self.total_tokens += tokens
+            cost = tokens * cost_per_token
+            self.estimated_cost += cost
+            self.calls += 1
+            self.usage_log.append({
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cost": cost,
+                "timestamp": self._get_timestamp()
+            })
+            
+            return self._totals()
+    
+    def log_usage_batch(self, prompt_tokens: Any, completion_tokens: Any,
+                        cost_per_token: Any = 0.000002,
+                        budget_limit: Optional[float] = None) -> Dict[str, Any]:
+        """Log many API calls at once, computing costs with NumPy.
+        
+        Costs are computed per call in vectorized form instead of one
+        log_usage() call per element. With a budget limit, calls are logged
+        up to and including the one that reaches it; later calls are dropped,
+        matching the per-call budget check in Agent.
+        
+        Args:
+            prompt_tokens: 1-D array-like of prompt token counts (a scalar
+                is treated as a single call)
+            completion_tokens: Completion token counts, same length
+            cost_per_token: Cost per token, scalar or per-call array
+            budget_limit: Optional budget limit in dollars
+        
+        Returns:
+            Dict: Usage statistics in JSON format, plus "logged": the number
+            of leading calls logged (calls from that index on were dropped)
+        
+        Raises:
+            ValueError: If the token counts are not integers, or the arrays
+                are not 1-D with matching lengths
+        """
+        import numpy as np  # only batch logging needs NumPy
+        
+        prompt = np.atleast_1d(np.asarray(prompt_tokens))
+        completion = np.atleast_1d(np.asarray(completion_tokens))
+        if prompt.ndim != 1 or prompt.shape != completion.shape:
+            raise ValueError("prompt_tokens and completion_tokens must be 1-D arrays of equal length")
+        for tokens in (prompt, completion):
+            # Reject rather than truncate, e.g. 1.7 silently becoming 1
+            if tokens.size and not np.issubdtype(tokens.dtype, np.integer):
+                raise ValueError("prompt_tokens and completion_tokens must be integer counts")
+        prompt = prompt.astype(np.int64, copy=False)
+        completion = completion.astype(np.int64, copy=False)
+        costs = (prompt + completion) * np.asarray(cost_per_token, dtype=np.float64)
+        if costs.shape != prompt.shape:
+            raise ValueError("cost_per_token must be a scalar or match the token arrays")
+        
+        with self._lock:
+            count = costs.shape[0]
+            if budget_limit is not None:
+                if self.estimated_cost >= budget_limit:
+                    count = 0
+                else:
+                    cumcost = self.estimated_cost + np.cumsum(costs)
+                    count = min(count, int(np.searchsorted(cumcost, budget_limit)) + 1)
+            prompt, completion, costs = prompt[:count], completion[:count], costs[:count]
+            
+            prompt_total = int(np.add.reduce(prompt))
+            completion_total = int(np.add.reduce(completion))
+            self.prompt_tokens += prompt_total
+            self.completion_tokens += completion_total
+            self.total_tokens += prompt_total + completion_total
+            self.estimated_cost += float(np.add.reduce(costs))
+            self.calls += count
+            
+            timestamp = self._get_timestamp()
+            start = max(0, count - self.log_capacity)
+            self.usage_log.extend(
+                {"prompt_tokens": p, "completion_tokens": c, "cost": cost, "timestamp": timestamp}
+                for p, c, cost in zip(prompt[start:].tolist(),
+                                      completion[start:].tolist(),
+                                      costs[start:].tolist())
+            )
+            
+            summary = self._totals()
+            summary["logged"] = count
+            return summary
+    
+    def is_budget_exceeded(self, budget_limit: float) -> bool:
+        """Check if budget limit is exceeded.
+        
+        Returns:
+            bool: True if budget exceeded
+        """
+        return self.estimated_cost >= budget_limit
+    
+    def reset(self) -> None:
+        """Zero all counters and clear the usage log."""
+        with self._lock:
+            self.total_tokens = 0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.estimated_cost = 0.0
+            self.calls = 0
+            self.usage_log.clear()
+    
+    def get_usage_summary(self, include_log: bool = False) -> Dict[str, Any]:
+        """Return usage statistics, optionally with the recent call log.
+        
+        Args:
+            include_log: Also copy the bounded per-call log into the output
+        
+        Returns:
+            Dict: Usage statistics in JSON format, plus "usage_log" if requested
+        """
+        with self._lock:
+            summary = self._totals()
+            entries = list(self.usage_log) if include_log else None
+        if include_log:
+            summary["usage_log"] = list(self._format_entries(entries))
+        return summary
+    
+    def iter_usage_log(self) -> Iterator[Dict[str, Any]]:
+        """Yield usage log entries one at a time, oldest first.
+        
+        Entries are formatted lazily, so callers can stream them (e.g. as
+        NDJSON) without building the whole formatted log in memory.
+        
+        Yields:
+            Dict: Log entry with an ISO 8601 timestamp
+        """
+        with self._lock:
+            entries = list(self.usage_log)
+        yield from self._format_entries(entries)
+    
+    @classmethod
+    def _format_entries(cls, entries: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield copies of log entries with ISO 8601 timestamps."""
+        for entry in entries:
+            yield {**entry, "timestamp": cls._format_timestamp(entry["timestamp"])}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return usage statistics as a dict (same shape as to_json)."""
+        with self._lock:
+            return self._totals()
+    
+    def _totals(self) -> Dict[str, Any]:
+        """Build the aggregate statistics dict; caller holds the lock."""
+        return {
+            "total_tokens": self.total_tokens,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "estimated_cost": round(self.estimated_cost, 4),
+            "calls": self.calls
+        }
+    
+    @staticmethod
+    def _get_timestamp() -> int:
+        """Current time in nanoseconds; formatted only when emitted."""
+        return time.time_ns()
+    
+    @staticmethod
+    def _format_timestamp(timestamp_ns: int) -> str:
+        """Convert a nanosecond timestamp to an ISO 8601 UTC string."""
+        return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+    
+    def to_json(self) -> str:
+        """Convert to JSON string."""
+        return _dumps(self.to_dict())
@@ -15,220 +15,27 @@ API Budget Control Examples:
     
     # Implement budget callbacks
     def on_budget_exceeded(usage):
-        logger.warning(f"Budget limit reached: {usage.cost}")
+        logger.warning("Budget limit reached: %s", usage.cost)
     agent.set_budget_callback(on_budget_exceeded)
 """
 
 import json
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+import sys
+from typing import Dict, Any
+
+from core._json import _dumps
+# Framework classes live in core/; re-exported here for existing imports
+from core.agent import Agent
+from core.tasks import Task, TaskConfig
+from core.usage import UsageTracker
+
+__all__ = ['Agent', 'ExampleTask', 'Task', 'TaskConfig', 'UsageTracker']
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# ============================================================================
-# MODULAR AGENT COMPONENTS
-# ============================================================================
-
-@dataclass
-class UsageTracker:
-    """Track API usage and costs.
-    
-    Structured Output:
-    {
-        "total_tokens": int,
-        "prompt_tokens": int,
-        "completion_tokens": int,
-        "estimated_cost": float,
-        "calls": int
-    }
-    """
-    total_tokens: int = 0
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    estimated_cost: float = 0.0
-    calls: int = 0
-    
-    def log_usage(self, prompt_tokens: int, completion_tokens: int, cost_per_1k: float = 0.002) -> Dict[str, Any]:
-        """Log API usage and return structured output.
-        
-        Returns:
-            Dict: Usage statistics in JSON format
-        """
-        self.prompt_tokens += prompt_tokens
-        self.completion_tokens += completion_tokens
-        self.total_tokens = self.prompt_tokens + self.completion_tokens
-        self.estimated_cost += (self.total_tokens / 1000) * cost_per_1k
-        self.calls += 1
-        
-        return {
-            "total_tokens": self.total_tokens,
-            "prompt_tokens": self.prompt_tokens,
-            "completion_tokens": self.completion_tokens,
-            "estimated_cost": round(self.estimated_cost, 4),
-            "calls": self.calls
-        }
-    
-    def is_budget_exceeded(self, budget_limit: float) -> bool:
-        """Check if budget limit is exceeded.
-        
-        Returns:
-            bool: True if budget exceeded
-        """
-        return self.estimated_cost >= budget_limit
-    
-    def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps({
-            "total_tokens": self.total_tokens,
-            "prompt_tokens": self.prompt_tokens,
-            "completion_tokens": self.completion_tokens,
-            "estimated_cost": round(self.estimated_cost, 4),
-            "calls": self.calls
-        })
-
-
-@dataclass
-class TaskConfig:
-    """Configuration for agent tasks.
-    
-    Structured Output:
-    {
-        "max_tokens": int,
-        "temperature": float,
-        "budget_limit": float,
-        "enable_tracking": bool
-    }
-    """
-    max_tokens: int = 1000
-    temperature: float = 0.7
-    budget_limit: float = 1.0
-    enable_tracking: bool = True
-
-
-class Task(ABC):
-    """Abstract base class for modular tasks."""
-    
-    @abstractmethod
-    def execute(self, **kwargs) -> Dict[str, Any]:
-        """Execute the task and return structured output.
-        
-        Returns:
-            Dict: Task results in JSON-compatible format
-        """
-        pass
-    
-    @abstractmethod
-    def validate_input(self, **kwargs) -> bool:
-        """Validate input parameters.
-        
-        Returns:
-            bool: True if valid
-        """
-        pass
-
-
-class Agent:
-    """Modular AI agent with budget control and structured output.
-    
-    Example usage:
-        agent = Agent(max_tokens=1000, budget_limit=0.50)
-        result = agent.execute_task(task, track_usage=True)
-    """
-    
-    def __init__(self, 
-                 max_tokens: int = 1000, 
-                 budget_limit: float = 1.0,
-                 cost_per_1k: float = 0.002):
-        """Initialize agent with budget controls.
-        
-        Args:
-            max_tokens: Maximum tokens per request
-            budget_limit: Maximum cost limit in dollars
-            cost_per_1k: Cost per 1000 tokens
-        """
-        self.config = TaskConfig(max_tokens=max_tokens, budget_limit=budget_limit)
-        self.usage_tracker = UsageTracker()
-        self.cost_per_1k = cost_per_1k
-        self.budget_callback: Optional[Callable[[UsageTracker], None]] = None
-        logger.info(f"Agent initialized with budget limit: ${budget_limit}")
-    
-    def set_budget_callback(self, callback: Callable[[UsageTracker], None]):
-        """Set callback for budget exceeded events.
-        
-        Args:
-            callback: Function to call when budget is exceeded
-        """
-        self.budget_callback = callback
-    
-    def check_budget(self) -> bool:
-        """Check if budget limit is exceeded.
-        
-        Returns:
-            bool: True if within budget
-        """
-        if self.usage_tracker.is_budget_exceeded(self.config.budget_limit):
-            if self.budget_callback:
-                self.budget_callback(self.usage_tracker)
-            logger.warning(f"Budget exceeded: ${self.usage_tracker.estimated_cost}")
-            return False
-        return True
-    
-    def execute_task(self, task: Task, track_usage: bool = True, **kwargs) -> Dict[str, Any]:
-        """Execute a task with budget control.
-        
-        Returns:
-            Dict: Structured output in JSON format:
-            {
-                "status": str,
-                "result": Any,
-                "usage": Dict[str, Any],
-                "within_budget": bool
-            }
-        """
-        if not task.validate_input(**kwargs):
-            return {
-                "status": "error",
-                "message": "Invalid input parameters",
-                "usage": json.loads(self.usage_tracker.to_json())
-            }
-        
-        if not self.check_budget():
-            return {
-                "status": "error",
-                "message": "Budget limit exceeded",
-                "usage": json.loads(self.usage_tracker.to_json()),
-                "within_budget": False
-            }
-        
-        try:
-            result = task.execute(**kwargs)
-            
-            if track_usage:
-                # Simulate token usage (in production, get from API response)
-                prompt_tokens = kwargs.get('prompt_tokens', 100)
-                completion_tokens = kwargs.get('completion_tokens', 50)
-                usage_data = self.usage_tracker.log_usage(prompt_tokens, completion_tokens, self.cost_per_1k)
-                
-                logger.info(f"Task completed. Usage: {usage_data}")
-            
-            return {
-                "status": "success",
-                "result": result,
-                "usage": json.loads(self.usage_tracker.to_json()),
-                "within_budget": self.check_budget()
-            }
-        except Exception as e:
-            logger.error(f"Task execution failed: {str(e)}")
-            return {
-                "status": "error",
-                "message": str(e),
-                "usage": json.loads(self.usage_tracker.to_json())
-            }
-
 
 # ============================================================================
 # TODO: MULTI-AGENT CONFIGURATION
@@ -254,7 +61,7 @@ class Agent:
 # TODO: Implement performance regression detection with alerts
 
 
-class ExampleTask(Task):
+class ExampleTask:
     """Example task implementation demonstrating modular design."""
     
     def validate_input(self, **kwargs) -> bool:
@@ -294,7 +101,7 @@ if __name__ == "__main__":
     
     # Set budget callback
     def on_budget_exceeded(usage: UsageTracker):
-        logger.warning(f"Budget limit reached! Cost: ${usage.estimated_cost}")
+        logger.warning("Budget limit reached! Cost: $%s", usage.estimated_cost)
         print(f"\nWARNING: Budget exceeded at ${usage.estimated_cost}")
     
     agent.set_budget_callback(on_budget_exceeded)
@@ -310,15 +117,23 @@ if __name__ == "__main__":
     )
     
     # Display structured output (JSON format)
+    # Stream the encoded output instead of building the whole string first
     print("\nTask Result (Structured JSON Output):")
-    print(json.dumps(result, indent=2))
+    for chunk in json.JSONEncoder(indent=2).iterencode(result):
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
     
     print("\nUsage Statistics:")
     print(agent.usage_tracker.to_json())
     
+    # One JSON object per line (NDJSON), so consumers can parse as it streams
+    print("\nUsage Log (NDJSON):")
+    for entry in agent.usage_tracker.iter_usage_log():
+        sys.stdout.write(_dumps(entry) + "\n")
+    
     print("\n" + "=" * 60)
     print("Features Demonstrated:")
-    print("✓ Modular agent design with ABC and dataclasses")
+    print("✓ Modular agent design with protocols and dataclasses")
     print("✓ Structured output in JSON format")
     print("✓ API budget controls and cost tracking")
     print("✓ TODO notes for multi-agent configuration")
@@ -0,0 +1,142 @@
+"""Tests for Agent concurrent execution and budget handling."""
+
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from core.agent import Agent
+
+# Each task logs the default 100 + 50 tokens at $0.002/1k
+CALL_COST = 0.0003
+
+
+class SleepTask:
+    """Async task that sleeps ``delay`` seconds before returning its query."""
+
+    def validate_input(self, **kwargs) -> bool:
+        return True
+
+    async def execute(self, **kwargs):
+        await asyncio.sleep(kwargs.get("delay", 0))
+        return {"query": kwargs.get("query")}
+
+
+class BlockingTask:
+    """Blocking task that sleeps ``delay`` seconds in its worker thread."""
+
+    def validate_input(self, **kwargs) -> bool:
+        return True
+
+    def execute(self, **kwargs):
+        time.sleep(kwargs.get("delay", 0))
+        return {"query": kwargs.get("query")}
+
+
+class AgentRunTests(unittest.TestCase):
+    def test_budget_cutoff_cancels_later_async_tasks(self):
+        agent = Agent(budget_limit=2 * CALL_COST)
+        for i in range(5):
+            agent.add_task(SleepTask(), query=i, delay=0.05 * i)
+
+        result = agent.run()
+
+        statuses = [r["status"] for r in result.results]
+        self.assertEqual(statuses, ["success", "success", "error", "error", "error"])
+        for r in result.results[2:]:
+            self.assertEqual(r["message"], "Budget limit exceeded")
+        self.assertEqual(result.usage["calls"], statuses.count("success"))
+
+    def test_running_blocking_task_usage_is_logged_at_cutoff(self):
+        agent = Agent(budget_limit=CALL_COST)
+        agent.add_task(BlockingTask(), query="fast", delay=0.01)
+        agent.add_task(BlockingTask(), query="slow", delay=0.2)
+
+        result = agent.run()
+
+        self.assertEqual([r["status"] for r in result.results], ["success", "success"])
+        self.assertEqual(agent.usage_tracker.calls, 2)
+
+    def test_results_keep_queue_order(self):
+        agent = Agent()
+        for i in range(4):
+            agent.add_task(SleepTask(), query=i, delay=0.05 * (4 - i))
+
+        result = agent.run()
+
+        self.assertEqual([r["result"]["query"] for r in result.results], [0, 1, 2, 3])
+
+    def test_cancelling_arun_cancels_task_handles(self):
+        cancelled = []
+
+        class HangingTask(SleepTask):
+            async def execute(self, **kwargs):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(kwargs["query"])
+                    raise
+
+        async def scenario():
+            agent = Agent()
+            for i in range(3):
+                agent.add_task(HangingTask(), query=i)
+            run = asyncio.create_task(agent.arun())
+            await asyncio.sleep(0.05)
+            run.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await run
+            others = asyncio.all_tasks() - {asyncio.current_task()}
+            self.assertEqual(others, set())
+
+        asyncio.run(scenario())
+        self.assertEqual(sorted(cancelled), [0, 1, 2])
+
+
+class BudgetNotificationTests(unittest.TestCase):
+    def setUp(self):
+        self.notified = []
+
+    def _agent(self, **kwargs):
+        agent = Agent(**kwargs)
+        agent.set_budget_callback(self.notified.append)
+        return agent
+
+    def test_callback_fires_once_across_repeated_checks(self):
+        agent = self._agent(budget_limit=CALL_COST)
+        agent.execute_task(BlockingTask())
+        for _ in range(3):
+            self.assertFalse(agent.check_budget())
+        self.assertEqual(len(self.notified), 1)
+
+    def test_callback_fires_once_under_threaded_run(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            agent = self._agent(budget_limit=CALL_COST, executor=executor)
+            for i in range(8):
+                agent.add_task(BlockingTask(), query=i, delay=0.01)
+            agent.run()
+            for _ in range(3):
+                agent.check_budget()
+        self.assertEqual(len(self.notified), 1)
+
+    def test_callback_rearms_after_reset(self):
+        agent = self._agent(budget_limit=CALL_COST)
+        agent.execute_task(BlockingTask())
+        agent.reset()
+        agent.set_budget_callback(self.notified.append)
+        self.assertTrue(agent.check_budget())
+        agent.execute_task(BlockingTask())
+        self.assertEqual(len(self.notified), 2)
+
+    def test_callback_rearms_after_limit_raised(self):
+        agent = self._agent(budget_limit=CALL_COST)
+        agent.execute_task(BlockingTask())
+        agent.config.budget_limit = 2 * CALL_COST
+        self.assertTrue(agent.check_budget())
+        agent.execute_task(BlockingTask())
+        agent.check_budget()
+        self.assertEqual(len(self.notified), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
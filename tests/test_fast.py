@@ -0,0 +1,39 @@
+"""Tests for the compiled budget scan and its pure-Python fallback."""
+
+import unittest
+
+from core._fast import _scan_budget, scan_budget
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "scan_budget operates on NumPy arrays")
+class ScanBudgetTests(unittest.TestCase):
+    def setUp(self):
+        self.prompt = np.full(10, 100, dtype=np.int64)
+        self.completion = np.full(10, 50, dtype=np.int64)
+
+    def assertScansAgree(self, budget, expected_index):
+        compiled = scan_budget(self.prompt, self.completion, 0.000002, budget)
+        fallback = _scan_budget(self.prompt, self.completion, 0.000002, budget)
+        self.assertEqual(compiled[0], expected_index)
+        self.assertEqual(fallback[0], expected_index)
+        self.assertAlmostEqual(compiled[1], fallback[1], places=12)
+        self.assertIs(type(compiled[1]), float)
+        self.assertIs(type(fallback[1]), float)
+
+    def test_budget_never_reached(self):
+        self.assertScansAgree(1.0, -1)
+
+    def test_budget_reached_on_first_call(self):
+        self.assertScansAgree(0.0001, 0)
+
+    def test_budget_reached_mid_run(self):
+        self.assertScansAgree(0.001, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
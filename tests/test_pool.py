@@ -0,0 +1,90 @@
+"""Tests for agent reuse: Agent.get_or_create and AgentPool."""
+
+import time
+import unittest
+
+from core.agent import Agent
+from core.pool import AgentPool
+
+
+class NoopTask:
+    def validate_input(self, **kwargs) -> bool:
+        return True
+
+    def execute(self, **kwargs):
+        return {}
+
+
+def _dirty(agent: Agent) -> Agent:
+    """Give an agent usage, a queued task and a callback to reset."""
+    agent.execute_task(NoopTask())
+    agent.add_task(NoopTask())
+    agent.set_budget_callback(lambda usage: None)
+    return agent
+
+
+class GetOrCreateTests(unittest.TestCase):
+    def setUp(self):
+        # The cache is process-global class state
+        Agent._cache.clear()
+        self.addCleanup(Agent._cache.clear)
+        self.addCleanup(setattr, Agent, "max_idle_sec", Agent.max_idle_sec)
+
+    def test_same_config_returns_cached_agent(self):
+        agent = Agent.get_or_create("DataProcessor", budget_limit=0.5)
+        self.assertIs(Agent.get_or_create("DataProcessor", budget_limit=0.5), agent)
+        self.assertIsNot(Agent.get_or_create("DataProcessor", budget_limit=0.25), agent)
+        self.assertIsNot(Agent.get_or_create("Planner", budget_limit=0.5), agent)
+
+    def test_cached_agent_is_reset_on_reuse(self):
+        agent = _dirty(Agent.get_or_create("DataProcessor"))
+        reused = Agent.get_or_create("DataProcessor")
+        self.assertIs(reused, agent)
+        self.assertEqual(reused.usage_tracker.calls, 0)
+        self.assertEqual(len(reused.tasks), 0)
+        self.assertIsNone(reused.budget_callback)
+
+    def test_idle_agents_are_evicted(self):
+        Agent.max_idle_sec = 0.01
+        agent = Agent.get_or_create("DataProcessor")
+        time.sleep(0.02)
+        Agent.get_or_create("Planner")
+        self.assertEqual([key[1] for key in Agent._cache], ["Planner"])
+        self.assertIsNot(Agent.get_or_create("DataProcessor"), agent)
+
+
+class AgentPoolTests(unittest.TestCase):
+    def test_acquire_uses_factory_when_empty(self):
+        created = []
+
+        def factory():
+            created.append(Agent())
+            return created[-1]
+
+        pool = AgentPool(factory)
+        first, second = pool.acquire(), pool.acquire()
+        self.assertEqual(created, [first, second])
+
+    def test_release_resets_and_reuses_agent(self):
+        pool = AgentPool(Agent)
+        agent = _dirty(pool.acquire())
+        pool.release(agent)
+        reused = pool.acquire()
+        self.assertIs(reused, agent)
+        self.assertEqual(reused.usage_tracker.calls, 0)
+        self.assertEqual(len(reused.tasks), 0)
+        self.assertIsNone(reused.budget_callback)
+
+    def test_release_beyond_max_size_drops_agent(self):
+        pool = AgentPool(Agent, max_size=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        self.assertIs(pool.acquire(), first)
+        fresh = pool.acquire()
+        self.assertIsNot(fresh, first)
+        self.assertIsNot(fresh, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for UsageTracker cost accounting."""
+
+import unittest
+
+from core.usage import UsageTracker
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class UsageTrackerCostTests(unittest.TestCase):
+    def test_log_usage_charges_only_current_call(self):
+        """Repeated calls must not re-bill earlier tokens (quadratic cost)."""
+        tracker = UsageTracker()
+        for _ in range(3):
+            tracker.log_usage(100, 50)
+        self.assertEqual(tracker.total_tokens, 450)
+        self.assertAlmostEqual(tracker.estimated_cost, 0.0009, places=12)
+        self.assertEqual(tracker.to_dict()["estimated_cost"], 0.0009)
+
+    @unittest.skipIf(numpy is None, "log_usage_batch requires NumPy")
+    def test_log_usage_matches_log_usage_batch(self):
+        single = UsageTracker()
+        for _ in range(3):
+            single.log_usage(100, 50)
+        batch = UsageTracker()
+        batch.log_usage_batch([100] * 3, [50] * 3)
+        self.assertEqual(single.total_tokens, batch.total_tokens)
+        self.assertAlmostEqual(single.estimated_cost, batch.estimated_cost, places=12)
+
+
+    @unittest.skipIf(numpy is None, "log_usage_batch requires NumPy")
+    def test_log_usage_batch_rejects_fractional_tokens(self):
+        tracker = UsageTracker()
+        with self.assertRaises(ValueError):
+            tracker.log_usage_batch([1.7], [1])
+        with self.assertRaises(ValueError):
+            tracker.log_usage_batch([1], [0.5])
+        self.assertEqual(tracker.calls, 0)
+        self.assertEqual(tracker.log_usage_batch([], [])["logged"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()